@@ -2,10 +2,14 @@
 
 import pytest
 from unittest.mock import create_autospec
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from .....models.academics.hiring.application_review import HiringStatus
 from .....services.academics.hiring import HiringService
 from .....services.permission import PermissionService
+from ... import user_data
+from ...office_hours import office_hours_data
 
 __authors__ = ["Ajay Gandecha"]
 __copyright__ = "Copyright 2024"
@@ -16,3 +20,20 @@ __license__ = "MIT"
 def hiring_svc(session: Session):
     """HiringService fixture."""
     return HiringService(session, PermissionService(session))
+
+
+@pytest.fixture()
+def initial_status(hiring_svc: HiringService) -> HiringStatus:
+    """Hiring status of the COMP 110 course site as seen by its instructor."""
+    return hiring_svc.get_status(
+        user_data.instructor, office_hours_data.comp_110_site.id
+    )
+
+
+@pytest.fixture(scope="module")
+def autohire_id_seq(module_session: Session):
+    """Moves the hiring assignment ID sequence past the fake data for autohire tests."""
+    module_session.execute(
+        text("SELECT setval('academics__hiring__assignment_id_seq', 100, true)")
+    )
+    module_session.commit()
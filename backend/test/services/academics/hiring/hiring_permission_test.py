@@ -0,0 +1,106 @@
+"""Tests that the HiringService enforces the hiring administration permission.
+
+These tests use a mocked session and PermissionService, so they do not need the test
+database or any inserted fake data."""
+
+import pytest
+from unittest.mock import create_autospec
+from sqlalchemy.orm import Session
+
+from .....models.user import User
+from .....services.academics import HiringService
+from .....services.exceptions import UserPermissionException
+from .....services.permission import PermissionService
+
+# Injected Service Fixtures
+from ...fixtures import permission_svc_mock
+
+# Test data
+from ... import user_data
+from ...academics import term_data
+from . import hiring_data
+
+__authors__ = ["Ajay Gandecha"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+@pytest.fixture()
+def hiring_svc_permission_denied(permission_svc_mock: PermissionService):
+    """HiringService fixture whose permission checks always fail."""
+    permission_svc_mock.enforce.side_effect = UserPermissionException(
+        "hiring.admin", "*"
+    )
+    return HiringService(create_autospec(Session), permission_svc_mock)
+
+
+@pytest.mark.parametrize(
+    "method,args_factory,user",
+    [
+        pytest.param(
+            "get_hiring_admin_overview",
+            lambda: (term_data.current_term.id,),
+            user_data.ambassador,
+            id="get_hiring_admin_overview-ambassador",
+        ),
+        pytest.param(
+            "create_hiring_assignment",
+            lambda: (hiring_data.new_hiring_assignment,),
+            user_data.ambassador,
+            id="create_hiring_assignment-ambassador",
+        ),
+        pytest.param(
+            "update_hiring_assignment",
+            lambda: (hiring_data.updated_hiring_assignment,),
+            user_data.ambassador,
+            id="update_hiring_assignment-ambassador",
+        ),
+        pytest.param(
+            "delete_hiring_assignment",
+            lambda: (hiring_data.hiring_assignment.id,),
+            user_data.ambassador,
+            id="delete_hiring_assignment-ambassador",
+        ),
+        pytest.param(
+            "get_hiring_levels",
+            lambda: (),
+            user_data.ambassador,
+            id="get_hiring_levels-ambassador",
+        ),
+        pytest.param(
+            "create_hiring_level",
+            lambda: (hiring_data.new_level,),
+            user_data.ambassador,
+            id="create_hiring_level-ambassador",
+        ),
+        pytest.param(
+            "update_hiring_level",
+            lambda: (hiring_data.updated_uta_level,),
+            user_data.ambassador,
+            id="update_hiring_level-ambassador",
+        ),
+        pytest.param(
+            "get_audit_history",
+            lambda: (hiring_data.hiring_assignment.id,),
+            user_data.student,
+            id="get_audit_history-student",
+        ),
+        pytest.param(
+            "run_autohire",
+            lambda: (term_data.current_term.id,),
+            user_data.instructor,
+            id="run_autohire-instructor",
+        ),
+    ],
+)
+def test_admin_permission_matrix(
+    hiring_svc_permission_denied: HiringService,
+    permission_svc_mock: PermissionService,
+    method: str,
+    args_factory,
+    user: User,
+):
+    """Ensures that hiring administration operations enforce the `hiring.admin` permission."""
+    with pytest.raises(UserPermissionException):
+        getattr(hiring_svc_permission_denied, method)(user, *args_factory())
+    permission_svc_mock.enforce.assert_called_once_with(user, "hiring.admin", "*")
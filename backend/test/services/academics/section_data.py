@@ -529,10 +529,10 @@ def insert_fake_data(session: Session):
     reset_table_id_seq(session, SectionEntity, SectionEntity.id, len(sections) + 100)
 
 
-@pytest.fixture(autouse=True)
-def fake_data_fixture(session: Session):
-    insert_fake_data(session)
-    session.commit()
+@pytest.fixture(scope="module", autouse=True)
+def fake_data_fixture(module_session: Session):
+    insert_fake_data(module_session)
+    module_session.commit()
 
 
 roster_csv = """Student,ID,SIS User ID,SIS Login ID,Section,Assignments Current Points,Assignments Final Points,Assignments Current Score,Assignments Unposted Current Score,Assignments Final Score,Assignments Unposted Final Score,Current Points,Final Points,Current Score,Unposted Current Score,Final Score,Unposted Final Score,Current Grade,Unposted Current Grade,Final Grade,Unposted Final Grade
@@ -2,9 +2,11 @@
 
 import pytest
 
+from collections.abc import Iterator
 from sqlalchemy import create_engine, text, Engine
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import OperationalError, ProgrammingError
+from xdist import get_xdist_worker_id
 
 from ...database import _engine_str
 from ...env import getenv
@@ -18,13 +20,13 @@ __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
 
-def reset_database():
+def reset_database(database: str = POSTGRES_DATABASE):
     engine = create_engine(_engine_str(""))
     with engine.connect() as connection:
         try:
             conn = connection.execution_options(autocommit=False)
             conn.execute(text("ROLLBACK"))  # Get out of transactional mode...
-            conn.execute(text(f"DROP DATABASE {POSTGRES_DATABASE}"))
+            conn.execute(text(f"DROP DATABASE {database}"))
         except ProgrammingError:
             ...
         except OperationalError:
@@ -33,22 +35,41 @@ def reset_database():
             )
             exit(1)
 
-        conn.execute(text(f"CREATE DATABASE {POSTGRES_DATABASE}"))
+        conn.execute(text(f"CREATE DATABASE {database}"))
         conn.execute(
-            text(
-                f"GRANT ALL PRIVILEGES ON DATABASE {POSTGRES_DATABASE} TO {POSTGRES_USER}"
-            )
+            text(f"GRANT ALL PRIVILEGES ON DATABASE {database} TO {POSTGRES_USER}")
         )
 
 
+def drop_database(database: str):
+    engine = create_engine(_engine_str(""))
+    with engine.connect() as connection:
+        conn = connection.execution_options(autocommit=False)
+        conn.execute(text("ROLLBACK"))  # Get out of transactional mode...
+        conn.execute(text(f"DROP DATABASE IF EXISTS {database}"))
+
+
 @pytest.fixture(scope="session")
-def test_engine() -> Engine:
-    reset_database()
-    return create_engine(_engine_str(POSTGRES_DATABASE))
+def test_engine(request: pytest.FixtureRequest) -> Iterator[Engine]:
+    """Engine bound to a test database private to the current pytest-xdist worker."""
+    worker_id = get_xdist_worker_id(request)
+    if worker_id == "master":
+        database = POSTGRES_DATABASE
+    else:
+        database = f"{POSTGRES_DATABASE}_{worker_id}"
 
+    reset_database(database)
+    engine = create_engine(_engine_str(database))
+    yield engine
 
-@pytest.fixture(scope="function")
-def session(test_engine: Engine):
+    if worker_id != "master":
+        engine.dispose()
+        drop_database(database)
+
+
+@pytest.fixture(scope="module")
+def module_session(test_engine: Engine):
+    """Module-scoped session that recreates the tables and seeds shared fake data."""
     entities.EntityBase.metadata.drop_all(test_engine)
     entities.EntityBase.metadata.create_all(test_engine)
     session = Session(test_engine)
@@ -56,3 +77,17 @@ def session(test_engine: Engine):
         yield session
     finally:
         session.close()
+
+
+@pytest.fixture(scope="function")
+def session(test_engine: Engine, module_session: Session):
+    """Session whose changes are rolled back after each test."""
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
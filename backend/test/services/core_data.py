@@ -15,13 +15,13 @@ __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
 
-@pytest.fixture(autouse=True)
-def setup_insert_data_fixture(session: Session):
-    role_data.insert_fake_data(session)
-    user_data.insert_fake_data(session)
-    permission_data.insert_fake_data(session)
-    organization_test_data.insert_fake_data(session)
-    event_test_data.insert_fake_data(session)
+@pytest.fixture(scope="module", autouse=True)
+def setup_insert_data_fixture(module_session: Session):
+    role_data.insert_fake_data(module_session)
+    user_data.insert_fake_data(module_session)
+    permission_data.insert_fake_data(module_session)
+    organization_test_data.insert_fake_data(module_session)
+    event_test_data.insert_fake_data(module_session)
 
-    session.commit()
+    module_session.commit()
     yield
@@ -440,10 +440,10 @@ def insert_fake_data(session: Session):
     session.commit()
 
 
-@pytest.fixture(autouse=True)
-def fake_data_fixture(session: Session):
-    insert_fake_data(session)
-    session.commit()
+@pytest.fixture(scope="module", autouse=True)
+def fake_data_fixture(module_session: Session):
+    insert_fake_data(module_session)
+    module_session.commit()
     yield
 
 